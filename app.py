@@ -7,6 +7,9 @@ from datetime import datetime, timedelta
 from io import BytesIO
 import json
 import base64
+import threading
+import unicodedata
+from bisect import bisect_left
 from math import ceil
 
 import requests
@@ -86,12 +89,80 @@ class Post(db.Model):
     def __repr__(self):
         return f"<Post {self.title}>"
 
+# -------------------------------
+# SUGGEST INDEX (in-memory prefix index)
+# -------------------------------
+# Sorted list of (folded_key, kind, id, label) tuples. Every word start of a
+# label gets its own key so "abap" also matches "Learn ABAP". Writers build a
+# new list and swap the reference, so readers never need the lock.
+_suggest_entries = []
+_suggest_lock = threading.Lock()
+
+_TURKISH_FOLD = str.maketrans({"İ": "i", "I": "i", "ı": "i"})
+
+def fold_text(value):
+    """Büyük/küçük harf ve aksanları (Türkçe İ/ı dahil) normalize eder."""
+    value = (value or "").translate(_TURKISH_FOLD)
+    value = unicodedata.normalize("NFKD", value)
+    value = "".join(ch for ch in value if not unicodedata.combining(ch))
+    return " ".join(value.casefold().split())
+
+def _suggest_keys(label):
+    words = fold_text(label).split(" ")
+    return {" ".join(words[i:]) for i in range(len(words)) if words[i]}
+
+def _suggest_items(kind, obj_id, label):
+    return [(key, kind, obj_id, label) for key in _suggest_keys(label)]
+
+def rebuild_suggest_index():
+    """Tüm başlık, etiket ve kategori adlarından index'i yeniden oluşturur."""
+    global _suggest_entries
+    entries = []
+    for p in Post.query.with_entities(Post.id, Post.title).all():
+        entries.extend(_suggest_items("post", p.id, p.title))
+    for t in Tag.query.with_entities(Tag.id, Tag.name).all():
+        entries.extend(_suggest_items("tag", t.id, t.name))
+    for c in Category.query.with_entities(Category.id, Category.name).all():
+        entries.extend(_suggest_items("category", c.id, c.name))
+    entries.sort()
+    with _suggest_lock:
+        _suggest_entries = entries
+
+def update_suggest_index(kind, obj_id, label=None):
+    """Tek bir kaydı index'ten çıkarır; label verilirse yeniden ekler."""
+    global _suggest_entries
+    with _suggest_lock:
+        entries = [e for e in _suggest_entries if not (e[1] == kind and e[2] == obj_id)]
+        if label:
+            entries.extend(_suggest_items(kind, obj_id, label))
+            entries.sort()
+        _suggest_entries = entries
+
+def suggest(prefix, limit=8):
+    folded = fold_text(prefix)
+    if not folded:
+        return []
+    entries = _suggest_entries
+    results = []
+    seen = set()
+    i = bisect_left(entries, (folded,))
+    while i < len(entries) and len(results) < limit:
+        key, kind, obj_id, label = entries[i]
+        if not key.startswith(folded):
+            break
+        if (kind, obj_id) not in seen:
+            seen.add((kind, obj_id))
+            results.append({"type": kind, "id": str(obj_id), "label": label})
+        i += 1
+    return results
+
 with app.app_context():
     db.create_all()
     if not Category.query.first():
         default_cat = Category(name="General", description="General topics")
         db.session.add(default_cat)
         db.session.commit()
+    rebuild_suggest_index()
 
 # -------------------------------
 # ADMIN HELPERS & ROUTES
@@ -154,6 +225,7 @@ def add_post():
             
             db.session.add(new_post)
             db.session.commit()
+            update_suggest_index("post", new_post.id, new_post.title)
             flash("✅ Yeni yazı eklendi!", "success")
             return redirect(url_for("manage_posts"))
         except Exception as e:
@@ -184,6 +256,7 @@ def edit_post(post_id):
                     post.tags.append(tag)
             
             db.session.commit()
+            update_suggest_index("post", post.id, post.title)
             flash("✅ Yazı güncellendi!", "success")
             return redirect(url_for("manage_posts"))
         except Exception as e:
@@ -202,6 +275,7 @@ def delete_post(post_id):
     post = Post.query.get_or_404(post_id)
     db.session.delete(post)
     db.session.commit()
+    update_suggest_index("post", post_id)
     flash("🗑️ Yazı silindi.", "success")
     return redirect(url_for("manage_posts"))
 
@@ -220,6 +294,7 @@ def add_category():
         new_cat = Category(name=name, description=request.form.get("description"))
         db.session.add(new_cat)
         db.session.commit()
+        update_suggest_index("category", new_cat.id, new_cat.name)
         flash("✅ Yeni kategori eklendi!", "success")
     else:
         flash("⚠️ Kategori adı boş veya zaten var!", "error")
@@ -233,6 +308,7 @@ def delete_category(cat_id):
         post.category_id = None
     db.session.delete(category)
     db.session.commit()
+    update_suggest_index("category", cat_id)
     flash("🗑️ Kategori silindi.", "success")
     return redirect(url_for("manage_categories"))
 
@@ -251,6 +327,7 @@ def add_tag():
         new_tag = Tag(name=name)
         db.session.add(new_tag)
         db.session.commit()
+        update_suggest_index("tag", new_tag.id, new_tag.name)
         flash("✅ Yeni etiket eklendi!", "success")
     else:
         flash("⚠️ Etiket adı boş veya zaten var!", "error")
@@ -262,6 +339,7 @@ def delete_tag(tag_id):
     tag = Tag.query.get_or_404(tag_id)
     db.session.delete(tag)
     db.session.commit()
+    update_suggest_index("tag", tag_id)
     flash("🗑️ Etiket silindi.", "success")
     return redirect(url_for("manage_tags"))
 
@@ -396,6 +474,12 @@ def api_categories():
         print(f"Error fetching categories: {e}")
         return jsonify({"error": str(e)}), 500
 
+@app.route("/api/suggest")
+def api_suggest():
+    prefix = request.args.get('prefix', '')
+    limit = min(max(request.args.get('limit', 8, type=int), 1), 20)
+    return jsonify(suggest(prefix, limit))
+
 @app.route("/api/tags")
 def api_tags():
     try:
@@ -568,6 +652,7 @@ def restore_json():
     db.session.commit()
     
     fix_sequences()
+    rebuild_suggest_index()
 
     flash("✅ Veritabanı başarıyla geri yüklendi!", "success")
     return redirect(url_for("manage_database"))